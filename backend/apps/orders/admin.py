@@ -4,6 +4,7 @@ from .models import Order, OrderItem
 class OrderItemInline(admin.TabularInline):
     model = OrderItem
     extra = 0
+    readonly_fields = ['subtotal']
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
@@ -11,3 +12,9 @@ class OrderAdmin(admin.ModelAdmin):
     list_filter = ['status', 'payment_status', 'created_at']
     search_fields = ['order_number', 'buyer__username']
     inlines = [OrderItemInline]
+    
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # Keep the order total in line with edited items; otherwise keep the total as entered
+        if any(formset.has_changed() for formset in formsets):
+            form.instance.update_total()
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-16 17:48
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_initial'),
+    ]
+
+    # A stored column can't be altered into a generated one, so it is
+    # dropped and re-added; the database recomputes existing rows
+    operations = [
+        migrations.RemoveField(
+            model_name='orderitem',
+            name='subtotal',
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='subtotal',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('price'), '*', models.F('quantity')), output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+    ]
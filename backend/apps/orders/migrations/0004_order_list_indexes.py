@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-16 17:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_orderitem_subtotal_generated'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['buyer', '-created_at'], name='orders_buyer_i_bfe3d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(fields=['vendor', 'order'], name='order_items_vendor__c05d88_idx'),
+        ),
+    ]
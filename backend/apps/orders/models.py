@@ -1,4 +1,9 @@
+import secrets
+from decimal import Decimal
 from django.db import models
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.conf import settings
 from apps.products.models import Product
 from apps.vendors.models import VendorProfile
@@ -37,10 +42,37 @@ class Order(models.Model):
         indexes = [
             models.Index(fields=['buyer', 'status']),
             models.Index(fields=['order_number']),
+            # Buyer order list, newest first
+            models.Index(fields=['buyer', '-created_at']),
         ]
     
     def __str__(self):
         return self.order_number
+    
+    @staticmethod
+    def generate_order_number():
+        """Generate a random order number like ORD-1A2B3C4D5E"""
+        return f"ORD-{secrets.token_hex(5).upper()}"
+    
+    def update_total(self):
+        """Recompute total_amount from stored items in a single UPDATE"""
+        items_total = OrderItem.objects.filter(order=OuterRef('pk')).values('order').annotate(
+            total=Sum('subtotal')
+        ).values('total')
+        Order.objects.filter(pk=self.pk).update(
+            total_amount=Coalesce(Subquery(items_total), Decimal('0')),
+            updated_at=timezone.now()
+        )
+        self.refresh_from_db(fields=['total_amount', 'updated_at'])
+    
+    def record_vendor_sales(self):
+        """Add this paid order's item subtotals to each vendor's sales counters"""
+        vendor_totals = self.items.values('vendor').annotate(total=Sum('subtotal'))
+        for row in vendor_totals:
+            VendorProfile.objects.filter(pk=row['vendor']).update(
+                total_sales=F('total_sales') + row['total'],
+                total_orders=F('total_orders') + 1
+            )
 
 class OrderItem(models.Model):
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='items')
@@ -48,12 +80,17 @@ class OrderItem(models.Model):
     vendor = models.ForeignKey(VendorProfile, on_delete=models.CASCADE)
     quantity = models.IntegerField()
     price = models.DecimalField(max_digits=10, decimal_places=2)
-    subtotal = models.DecimalField(max_digits=10, decimal_places=2)
+    # Maintained by the database from price and quantity
+    subtotal = models.GeneratedField(
+        expression=F('price') * F('quantity'),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+    )
     status = models.CharField(max_length=20, default='pending')
     
     class Meta:
         db_table = 'order_items'
-    
-    def save(self, *args, **kwargs):
-        self.subtotal = self.price * self.quantity
-        super().save(*args, **kwargs)
+        indexes = [
+            # Vendor order list looks up orders through their items
+            models.Index(fields=['vendor', 'order']),
+        ]
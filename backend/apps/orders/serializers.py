@@ -1,16 +1,40 @@
+import copy
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from .models import Order, OrderItem
-from apps.products.serializers import ProductSerializer
+from apps.products.serializers import ProductSerializer, ProductSummarySerializer
+from apps.users.models import DEFERRED_USER_FIELDS
 
-class OrderItemSerializer(serializers.ModelSerializer):
+UNUSED_BUYER_FIELDS = [f'buyer__{field}' for field in DEFERRED_USER_FIELDS]
+
+class CachedFieldsMixin:
+    """Build ModelSerializer fields once per class and give each instance a copy"""
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        # Deep copies are fresh, unbound fields, as DRF does for declared fields
+        return copy.deepcopy(self._fields_cache[cls])
+    
+    @cached_property
+    def _readable_fields(self):
+        # Resolved once per instance; a many=True child reuses it for every row
+        return [field for field in self.fields.values() if not field.write_only]
+
+class OrderItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     product_details = ProductSerializer(source='product', read_only=True)
+    # DRF has no mapping for GeneratedField; render it like the other money fields
+    subtotal = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
     
     class Meta:
         model = OrderItem
         fields = '__all__'
         read_only_fields = ['subtotal', 'vendor']
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, read_only=True)
     buyer_name = serializers.CharField(source='buyer.get_full_name', read_only=True)
     
@@ -18,6 +42,37 @@ class OrderSerializer(serializers.ModelSerializer):
         model = Order
         fields = '__all__'
         read_only_fields = ['buyer', 'order_number', 'payment_status']
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load everything the nested items and product details render"""
+        items = OrderItem.objects.select_related('product__vendor').prefetch_related(
+            'product__images', 'product__variations'
+        )
+        return queryset.select_related('buyer').prefetch_related(Prefetch('items', queryset=items))
+
+    def update(self, instance, validated_data):
+        """Write only the submitted columns instead of the whole row"""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
+class OrderItemListSerializer(OrderItemSerializer):
+    # Lists only label each item; full product details stay on the order detail
+    product_details = ProductSummarySerializer(source='product', read_only=True)
+
+class OrderListSerializer(OrderSerializer):
+    items = OrderItemListSerializer(many=True, read_only=True)
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the buyer and item products the list renders"""
+        # Product summaries never render the description text
+        items = OrderItem.objects.select_related('product').defer('product__description')
+        return queryset.select_related('buyer').defer(*UNUSED_BUYER_FIELDS).prefetch_related(
+            Prefetch('items', queryset=items)
+        )
 
 class OrderCreateSerializer(serializers.Serializer):
     items = serializers.ListField(child=serializers.DictField())
@@ -0,0 +1,62 @@
+from decimal import Decimal
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.products.models import Category, Product
+from apps.users.models import User
+from apps.vendors.models import VendorProfile
+from .models import Order, OrderItem
+
+class OrderDetailAccessTests(APITestCase):
+    def setUp(self):
+        self.buyer = User.objects.create_user('buyer', 'buyer@example.com', 'pass12345')
+        self.other_buyer = User.objects.create_user('other', 'other@example.com', 'pass12345')
+        self.vendor = User.objects.create_user('vendor', 'vendor@example.com', 'pass12345', role='vendor')
+        vendor_profile = VendorProfile.objects.create(
+            user=self.vendor, business_name='Shop', business_description='Shop',
+            business_address='Street 1', business_phone='123', business_email='shop@example.com'
+        )
+        category = Category.objects.create(name='Category', slug='category')
+        product = Product.objects.create(
+            vendor=vendor_profile, category=category, name='Product', slug='product',
+            description='Product', price=Decimal('10.00'), stock=10, sku='SKU-1'
+        )
+        self.order = Order.objects.create(
+            buyer=self.buyer, order_number='ORD-TEST', total_amount=Decimal('10.00'),
+            shipping_address='Street 2', shipping_city='City', shipping_country='Country',
+            shipping_postal_code='1000', payment_method='stripe'
+        )
+        OrderItem.objects.create(
+            order=self.order, product=product, vendor=vendor_profile, quantity=1, price=Decimal('10.00')
+        )
+        self.url = f'/api/orders/{self.order.pk}/'
+
+    def test_buyer_can_read_and_update_own_order(self):
+        self.client.force_authenticate(self.buyer)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        response = self.client.patch(self.url, {'notes': 'Leave at the door'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.notes, 'Leave at the door')
+
+    def test_other_buyer_gets_404(self):
+        self.client.force_authenticate(self.other_buyer)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.patch(self.url, {'notes': 'x'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_vendor_can_read_order_with_their_items(self):
+        self.client.force_authenticate(self.vendor)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.order.pk)
+
+    def test_vendor_cannot_update_order(self):
+        self.client.force_authenticate(self.vendor)
+        response = self.client.patch(self.url, {
+            'total_amount': '0.01', 'status': 'delivered', 'shipping_address': 'vendor-edited'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.total_amount, Decimal('10.00'))
+        self.assertEqual(self.order.status, 'pending')
+        self.assertEqual(self.order.shipping_address, 'Street 2')
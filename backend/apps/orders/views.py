@@ -1,22 +1,31 @@
+from decimal import Decimal
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
 from .models import Order, OrderItem
-from .serializers import OrderSerializer, OrderCreateSerializer
+from .serializers import OrderSerializer, OrderListSerializer, OrderCreateSerializer
+from apps.products.caching import bump_products_version
 from apps.products.models import Product
-import uuid
+
+# Keeps each INSERT statement bounded for very large carts
+ORDER_ITEM_BATCH_SIZE = 500
 
 class OrderListView(generics.ListAPIView):
-    serializer_class = OrderSerializer
+    serializer_class = OrderListSerializer
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
         user = self.request.user
+        queryset = OrderListSerializer.setup_eager_loading(Order.objects.all())
         if user.role == 'admin':
-            return Order.objects.all()
+            return queryset
         elif user.role == 'vendor':
-            return Order.objects.filter(items__vendor=user.vendor_profile).distinct()
-        return Order.objects.filter(buyer=user)
+            # Subquery on the user avoids loading vendor_profile and a DISTINCT over the join
+            vendor_items = OrderItem.objects.filter(order=OuterRef('pk'), vendor__user=user)
+            return queryset.filter(Exists(vendor_items))
+        return queryset.filter(buyer=user)
 
 class OrderCreateView(generics.CreateAPIView):
     serializer_class = OrderCreateSerializer
@@ -24,67 +33,95 @@ class OrderCreateView(generics.CreateAPIView):
     
     @transaction.atomic
     def create(self, request, *args, **kwargs):
-        from rest_framework import serializers as drf_serializers
-        
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         order_data = serializer.validated_data
-        total = 0
+        order_items = []
+        total = Decimal('0')
         
         # Check if user is a vendor trying to order their own products
         if request.user.role == 'vendor':
-            try:
-                vendor_profile = request.user.vendor_profile
-                for item_data in order_data['items']:
-                    product = Product.objects.get(id=item_data['product_id'])
-                    if product.vendor == vendor_profile:
-                        raise drf_serializers.ValidationError({
-                            'detail': f'You cannot purchase your own product: {product.name}'
-                        })
-            except Exception as e:
-                if 'cannot purchase your own product' in str(e):
-                    raise
+            # One query fetching only the name, not every full product row
+            own_product = Product.objects.filter(
+                id__in=[item_data['product_id'] for item_data in order_data['items']],
+                vendor__user=request.user
+            ).values_list('name', flat=True).first()
+            if own_product is not None:
+                raise ValidationError({
+                    'detail': f'You cannot purchase your own product: {own_product}'
+                })
         
-        order = Order.objects.create(
-            buyer=request.user,
-            order_number=f"ORD-{uuid.uuid4().hex[:10].upper()}",
-            shipping_address=order_data['shipping_address'],
-            shipping_city=order_data['shipping_city'],
-            shipping_country=order_data['shipping_country'],
-            shipping_postal_code=order_data['shipping_postal_code'],
-            payment_method=order_data['payment_method'],
-            total_amount=0
+        # Lock every ordered product in one query so concurrent orders can't both pass the stock check
+        products = Product.objects.select_for_update().in_bulk(
+            [item_data['product_id'] for item_data in order_data['items']]
         )
         
         for item_data in order_data['items']:
-            product = Product.objects.get(id=item_data['product_id'])
+            # in_bulk keys are ints; ids may arrive as numeric strings
+            product = products.get(int(item_data['product_id']))
+            if product is None:
+                raise ValidationError(f"Product {item_data['product_id']} not found")
             quantity = item_data['quantity']
             
             if product.stock < quantity:
-                from rest_framework import serializers as drf_serializers
-                raise drf_serializers.ValidationError(f"Insufficient stock for {product.name}")
+                raise ValidationError(f"Insufficient stock for {product.name}")
+            # Track remaining stock in case the same product appears twice
+            product.stock -= quantity
             
-            order_item = OrderItem.objects.create(
-                order=order,
-                product=product,
-                vendor=product.vendor,
+            order_items.append(OrderItem(
+                product_id=product.pk,
+                vendor_id=product.vendor_id,
                 quantity=quantity,
                 price=product.price
-            )
+            ))
+            total += product.price * quantity
             
-            product.stock -= quantity
-            product.sales_count += quantity
-            product.save()
-            
-            total += order_item.subtotal
+            # Write only the counters rather than the whole product row
+            Product.objects.filter(pk=product.pk).update(
+                stock=F('stock') - quantity,
+                sales_count=F('sales_count') + quantity
+            )
         
-        order.total_amount = total
-        order.save()
+        order = Order.objects.create(
+            buyer=request.user,
+            order_number=Order.generate_order_number(),
+            shipping_address=order_data['shipping_address'],
+            shipping_city=order_data['shipping_city'],
+            shipping_country=order_data['shipping_country'],
+            shipping_postal_code=order_data['shipping_postal_code'],
+            payment_method=order_data['payment_method'],
+            # Items are priced before the order exists, so it is inserted with its final total
+            total_amount=total
+        )
+        
+        for order_item in order_items:
+            order_item.order_id = order.pk
+        # Batched INSERTs for all items; subtotal is filled in by the database
+        OrderItem.objects.bulk_create(order_items, batch_size=ORDER_ITEM_BATCH_SIZE)
+        # Stock and sales counts changed without post_save; invalidate after commit
+        transaction.on_commit(bump_products_version, robust=True)
         
+        # Reload with the nested items and products the response renders
+        order = OrderSerializer.setup_eager_loading(Order.objects.filter(pk=order.pk)).get()
         return Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
 
 class OrderDetailView(generics.RetrieveUpdateAPIView):
-    queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        user = self.request.user
+        queryset = OrderSerializer.setup_eager_loading(Order.objects.all())
+        if user.role == 'admin':
+            return queryset
+        elif user.role == 'vendor' and self.request.method in permissions.SAFE_METHODS:
+            # Vendors can read orders containing their products, but only the buyer can change them
+            vendor_items = OrderItem.objects.filter(order=OuterRef('pk'), vendor__user=user)
+            return queryset.filter(Q(buyer=user) | Exists(vendor_items))
+        return queryset.filter(buyer=user)
+    
+    def perform_update(self, serializer):
+        order = serializer.save()
+        # DRF discards the prefetched items after a save; reload them in bulk
+        serializer.instance = self.get_queryset().get(pk=order.pk)
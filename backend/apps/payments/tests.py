@@ -0,0 +1,76 @@
+from decimal import Decimal
+from unittest import mock
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.orders.models import Order, OrderItem
+from apps.products.models import Category, Product
+from apps.users.models import User
+from apps.vendors.models import VendorProfile
+from .models import Payment
+
+class VendorSalesCounterTests(APITestCase):
+    def setUp(self):
+        self.buyer = User.objects.create_user('buyer', 'buyer@example.com', 'pass12345')
+        category = Category.objects.create(name='Category', slug='category')
+        self.vendors = []
+        for idx, price in enumerate([Decimal('10.00'), Decimal('4.00')]):
+            user = User.objects.create_user(f'vendor{idx}', f'vendor{idx}@example.com', 'pass12345', role='vendor')
+            vendor = VendorProfile.objects.create(
+                user=user, business_name=f'Shop {idx}', business_description='Shop',
+                business_address='Street 1', business_phone='123', business_email=f'shop{idx}@example.com'
+            )
+            product = Product.objects.create(
+                vendor=vendor, category=category, name=f'Product {idx}', slug=f'product-{idx}',
+                description='Product', price=price, stock=10, sku=f'SKU-{idx}'
+            )
+            self.vendors.append((vendor, product))
+        self.order = Order.objects.create(
+            buyer=self.buyer, order_number='ORD-TEST', total_amount=Decimal('28.00'),
+            shipping_address='Street 2', shipping_city='City', shipping_country='Country',
+            shipping_postal_code='1000', payment_method='stripe'
+        )
+        for (vendor, product), quantity in zip(self.vendors, [2, 2]):
+            OrderItem.objects.create(
+                order=self.order, product=product, vendor=vendor, quantity=quantity, price=product.price
+            )
+
+    def assertVendorCounters(self, expected):
+        for (vendor, _), (total_sales, total_orders) in zip(self.vendors, expected):
+            vendor.refresh_from_db()
+            self.assertEqual(vendor.total_sales, total_sales)
+            self.assertEqual(vendor.total_orders, total_orders)
+
+    def test_placing_an_order_does_not_count_sales(self):
+        self.assertVendorCounters([(Decimal('0.00'), 0), (Decimal('0.00'), 0)])
+
+    @override_settings(STRIPE_SECRET_KEY='')
+    def test_test_mode_payment_counts_sales_once(self):
+        self.client.force_authenticate(self.buyer)
+        data = {'order_id': self.order.pk, 'payment_method': 'stripe'}
+        response = self.client.post('/api/payments/create-intent/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertVendorCounters([(Decimal('20.00'), 1), (Decimal('8.00'), 1)])
+
+        # A second attempt can't create another payment for the order
+        response = self.client.post('/api/payments/create-intent/', data, format='json')
+        self.assertNotEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Payment.objects.filter(order=self.order).count(), 1)
+        self.assertVendorCounters([(Decimal('20.00'), 1), (Decimal('8.00'), 1)])
+
+    def test_redelivered_webhook_counts_sales_once(self):
+        Payment.objects.create(
+            order=self.order, payment_method='stripe', transaction_id='pi_test', amount=self.order.total_amount
+        )
+        event = {'type': 'payment_intent.succeeded', 'data': {'object': {'id': 'pi_test'}}}
+        with mock.patch('apps.payments.views.get_stripe') as get_stripe:
+            get_stripe.return_value.Webhook.construct_event.return_value = event
+            # Stripe sends no credentials; the signature check authenticates it
+            for _ in range(2):
+                response = self.client.post('/api/payments/webhook/stripe/', {}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.payment_status, 'completed')
+        self.assertEqual(self.order.status, 'confirmed')
+        self.assertVendorCounters([(Decimal('20.00'), 1), (Decimal('8.00'), 1)])
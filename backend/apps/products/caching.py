@@ -0,0 +1,55 @@
+"""
+Versioned caching for product listings
+Cached payloads embed the current products version in their key, so a
+single increment invalidates every listing at once
+"""
+
+import logging
+import time
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_CACHE_TIMEOUT = 60 * 15
+PRODUCTS_VERSION_KEY = 'products_version'
+
+
+def get_products_version():
+    """Return the current products version, initialising it if missing"""
+    version = cache.get(PRODUCTS_VERSION_KEY)
+    if version is None:
+        # Seed from the clock so an evicted counter never reuses old keys
+        cache.add(PRODUCTS_VERSION_KEY, int(time.time()), None)
+        version = cache.get(PRODUCTS_VERSION_KEY)
+    return version
+
+
+def bump_products_version():
+    """Invalidate every cached product listing"""
+    try:
+        try:
+            cache.incr(PRODUCTS_VERSION_KEY)
+        except ValueError:
+            # Counter was evicted, start a fresh one
+            get_products_version()
+    except RedisError:
+        # The cache is optional; listings expire on their own TTL
+        logger.warning('Could not invalidate cached product listings', exc_info=True)
+
+
+def get_cached_listing(name, build):
+    """Return the cached payload for a listing, building it on a miss"""
+    try:
+        key = f"{name}:v{get_products_version()}"
+        data = cache.get(key)
+    except RedisError:
+        # Serve uncached while the cache is unreachable
+        return build()
+    if data is None:
+        data = build()
+        try:
+            cache.set(key, data, PRODUCT_CACHE_TIMEOUT)
+        except RedisError:
+            pass
+    return data
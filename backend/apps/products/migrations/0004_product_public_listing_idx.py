@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_merge_0002_initial_0002_product_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(
+                condition=models.Q(('is_active', True), ('status', 'published')),
+                fields=['-featured', '-created_at'],
+                name='products_public_listing_idx',
+            ),
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from apps.vendors.models import VendorProfile
+from .caching import bump_products_version
 
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -48,6 +53,12 @@ class Product(models.Model):
             models.Index(fields=['vendor', 'is_active']),
             models.Index(fields=['category']),
             models.Index(fields=['status']),
+            # Public listing: only active, published rows, featured then newest
+            models.Index(
+                fields=['-featured', '-created_at'],
+                condition=Q(is_active=True, status='published'),
+                name='products_public_listing_idx',
+            ),
         ]
     
     def __str__(self):
@@ -55,8 +66,12 @@ class Product(models.Model):
     
     def is_complete(self):
         """Check if product has all required information to be published"""
-        has_images = self.images.exists()
-        has_category = self.category is not None
+        # Reuse prefetched images (list views) instead of querying per product
+        if 'images' in getattr(self, '_prefetched_objects_cache', {}):
+            has_images = len(self.images.all()) > 0
+        else:
+            has_images = self.images.exists()
+        has_category = self.category_id is not None
         has_basic_info = all([
             self.name,
             self.description,
@@ -68,11 +83,11 @@ class Product(models.Model):
     
     def update_status(self):
         """Automatically update status based on completeness"""
-        if self.is_complete():
-            self.status = 'published'
-        else:
-            self.status = 'draft'
-        self.save(update_fields=['status'])
+        status = 'published' if self.is_complete() else 'draft'
+        # Skip the write, and its post_save work, when nothing changed
+        if status != self.status:
+            self.status = status
+            self.save(update_fields=['status'])
 
 class ProductImage(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='images')
@@ -89,10 +104,19 @@ class ProductVariation(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='variations')
     name = models.CharField(max_length=100)
     value = models.CharField(max_length=100)
-    price_adjustment = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    price_adjustment = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
     stock = models.IntegerField(default=0)
     sku = models.CharField(max_length=100, unique=True)
     
     class Meta:
         db_table = 'product_variations'
         unique_together = ['product', 'name', 'value']
+
+# Listings also render each product's images, variations and vendor name
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=ProductImage)
+@receiver([post_save, post_delete], sender=ProductVariation)
+@receiver([post_save, post_delete], sender=VendorProfile)
+def invalidate_product_listings(sender, **kwargs):
+    # Only invalidate once the write is committed, and keep cache I/O out of the transaction
+    transaction.on_commit(bump_products_version, robust=True)
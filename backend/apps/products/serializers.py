@@ -20,16 +20,18 @@ class ProductSerializer(serializers.ModelSerializer):
     images = ProductImageSerializer(many=True, read_only=True)
     variations = ProductVariationSerializer(many=True, read_only=True)
     vendor_name = serializers.CharField(source='vendor.business_name', read_only=True)
-    is_complete = serializers.SerializerMethodField()
+    # DRF calls Product.is_complete() itself, no serializer method needed
+    is_complete = serializers.BooleanField(read_only=True)
     
     class Meta:
         model = Product
         fields = '__all__'
         read_only_fields = ['vendor', 'views', 'sales_count', 'status']
     
-    def get_is_complete(self, obj):
-        """Check if product has all required information"""
-        return obj.is_complete()
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the relations each serialized product renders"""
+        return queryset.select_related('vendor').prefetch_related('images', 'variations')
     
     def create(self, validated_data):
         """Create product and set initial status to draft"""
@@ -42,3 +44,8 @@ class ProductSerializer(serializers.ModelSerializer):
         product = super().update(instance, validated_data)
         product.update_status()
         return product
+
+class ProductSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = ['id', 'name', 'slug', 'price']
@@ -1,11 +1,17 @@
+import json
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from django.core.cache import cache
-from .models import Category, Product, ProductImage
+from rest_framework.exceptions import ValidationError
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import F, prefetch_related_objects
+from .filters import ProductFilter
+from .models import Category, Product, ProductImage, ProductVariation
 from .serializers import CategorySerializer, ProductSerializer, ProductImageSerializer
 from apps.vendors.permissions import IsVendor
 from .recommendations import ProductRecommendations
+from .caching import get_cached_listing
 
 class CategoryListView(generics.ListCreateAPIView):
     queryset = Category.objects.filter(is_active=True)
@@ -25,16 +31,16 @@ class ProductListView(generics.ListAPIView):
     # Only show published products on public listing
     serializer_class = ProductSerializer
     permission_classes = [permissions.AllowAny]
-    filterset_fields = ['category', 'vendor', 'featured']
+    filterset_class = ProductFilter
     search_fields = ['name', 'description']
     ordering_fields = ['price', 'created_at', 'sales_count', 'featured']
     
     def get_queryset(self):
         # Order by: featured first, then newest first
-        return Product.objects.filter(
+        return ProductSerializer.setup_eager_loading(Product.objects.filter(
             is_active=True, 
             status='published'
-        ).select_related('vendor', 'category').order_by(
+        )).order_by(
             '-featured',  # Featured products first
             '-created_at'  # Then newest products
         )
@@ -43,54 +49,62 @@ class ProductCreateView(generics.CreateAPIView):
     serializer_class = ProductSerializer
     permission_classes = [permissions.IsAuthenticated, IsVendor]
     
+    @transaction.atomic
     def perform_create(self, serializer):
-        try:
-            vendor_profile = self.request.user.vendor_profile
-            product = serializer.save(vendor=vendor_profile, status='draft')
-            
-            # Handle image uploads
-            images = self.request.FILES.getlist('images')
-            for idx, image in enumerate(images):
-                is_primary = self.request.data.get(f'image_{idx}_is_primary', 'false').lower() == 'true'
-                order = int(self.request.data.get(f'image_{idx}_order', idx))
-                ProductImage.objects.create(
-                    product=product,
-                    image=image,
-                    is_primary=is_primary,
-                    order=order
-                )
-            
-            # Handle variations if provided
-            import json
-            variations_data = self.request.data.get('variations')
-            if variations_data:
-                try:
-                    variations = json.loads(variations_data)
-                    from .models import ProductVariation
-                    for var in variations:
-                        if var.get('name') and var.get('value'):
-                            ProductVariation.objects.create(
-                                product=product,
-                                name=var['name'],
-                                value=var['value'],
-                                price_adjustment=var.get('price_adjustment', 0),
-                                stock=var.get('stock', 0),
-                                sku=var.get('sku', f"{product.sku}-{var['value']}")
-                            )
-                except:
-                    pass
-            
-            # Update product status based on completeness
-            product.update_status()
-            
-        except:
-            from rest_framework.exceptions import ValidationError
+        vendor_profile = getattr(self.request.user, 'vendor_profile', None)
+        if vendor_profile is None:
             raise ValidationError({
                 'detail': 'Please complete your vendor profile setup before adding products.'
             })
+        product = serializer.save(vendor=vendor_profile, status='draft')
+        
+        # Handle image uploads
+        images = self.request.FILES.getlist('images')
+        product_images = []
+        for idx, image in enumerate(images):
+            is_primary = self.request.data.get(f'image_{idx}_is_primary', 'false').lower() == 'true'
+            try:
+                order = int(self.request.data.get(f'image_{idx}_order', idx))
+            except (TypeError, ValueError):
+                raise ValidationError({f'image_{idx}_order': 'A valid integer is required.'})
+            product_images.append(ProductImage(
+                product=product,
+                image=image,
+                is_primary=is_primary,
+                order=order
+            ))
+        # Single INSERT for all images
+        ProductImage.objects.bulk_create(product_images)
+        
+        # Handle variations if provided
+        variations_data = self.request.data.get('variations')
+        if variations_data:
+            try:
+                variations = json.loads(variations_data)
+                # Duplicate variations are skipped, as before, in a single INSERT; the
+                # savepoint keeps a rejected INSERT from breaking the outer transaction
+                with transaction.atomic():
+                    ProductVariation.objects.bulk_create([
+                        ProductVariation(
+                            product=product,
+                            name=var['name'],
+                            value=var['value'],
+                            price_adjustment=var.get('price_adjustment', 0),
+                            stock=var.get('stock', 0),
+                            sku=var.get('sku', f"{product.sku}-{var['value']}")
+                        )
+                        for var in variations
+                        if var.get('name') and var.get('value')
+                    ], ignore_conflicts=True)
+            except (ValueError, TypeError, KeyError, AttributeError, DjangoValidationError):
+                # Malformed variations are skipped, as before
+                pass
+        
+        # Update product status based on completeness
+        product.update_status()
 
 class ProductDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Product.objects.all()
+    queryset = ProductSerializer.setup_eager_loading(Product.objects.all())
     serializer_class = ProductSerializer
     
     def get_permissions(self):
@@ -100,8 +114,10 @@ class ProductDetailView(generics.RetrieveUpdateDestroyAPIView):
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
+        # Increment in the database so concurrent views aren't lost and the
+        # row isn't rewritten through the model save path
+        Product.objects.filter(pk=instance.pk).update(views=F('views') + 1)
         instance.views += 1
-        instance.save(update_fields=['views'])
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -110,11 +126,11 @@ class VendorProductListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated, IsVendor]
     
     def get_queryset(self):
-        try:
-            return Product.objects.filter(vendor=self.request.user.vendor_profile)
-        except:
-            # User doesn't have a vendor profile yet
-            return Product.objects.none()
+        # Filter through the join so a missing vendor profile simply yields
+        # no rows, without loading the profile first
+        return ProductSerializer.setup_eager_loading(
+            Product.objects.filter(vendor__user=self.request.user)
+        )
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
@@ -127,6 +143,8 @@ def product_recommendations(request, pk):
             user=request.user if request.user.is_authenticated else None,
             limit=8
         )
+        # Recommendations are a merged list, so prefetch onto the instances
+        prefetch_related_objects(recommendations, 'vendor', 'images', 'variations')
         serializer = ProductSerializer(recommendations, many=True)
         return Response(serializer.data)
     except Product.DoesNotExist:
@@ -138,7 +156,9 @@ def similar_products(request, pk):
     """Get similar products"""
     try:
         product = Product.objects.get(pk=pk, is_active=True, status='published')
-        similar = ProductRecommendations.get_similar_products(product, limit=8)
+        similar = ProductSerializer.setup_eager_loading(
+            ProductRecommendations.get_similar_products(product, limit=8)
+        )
         serializer = ProductSerializer(similar, many=True)
         return Response(serializer.data)
     except Product.DoesNotExist:
@@ -148,17 +168,19 @@ def similar_products(request, pk):
 @permission_classes([permissions.AllowAny])
 def trending_products(request):
     """Get trending products"""
-    trending = ProductRecommendations.get_trending_products(limit=12)
-    serializer = ProductSerializer(trending, many=True)
-    return Response(serializer.data)
+    data = get_cached_listing('trending_products', lambda: ProductSerializer(
+        ProductSerializer.setup_eager_loading(ProductRecommendations.get_trending_products(limit=12)), many=True
+    ).data)
+    return Response(data)
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def best_sellers(request):
     """Get best selling products"""
-    best_sellers = ProductRecommendations.get_best_sellers(limit=12)
-    serializer = ProductSerializer(best_sellers, many=True)
-    return Response(serializer.data)
+    data = get_cached_listing('best_sellers', lambda: ProductSerializer(
+        ProductSerializer.setup_eager_loading(ProductRecommendations.get_best_sellers(limit=12)), many=True
+    ).data)
+    return Response(data)
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
@@ -168,5 +190,5 @@ def personalized_recommendations(request):
         user=request.user if request.user.is_authenticated else None,
         limit=12
     )
-    serializer = ProductSerializer(recommendations, many=True)
+    serializer = ProductSerializer(ProductSerializer.setup_eager_loading(recommendations), many=True)
     return Response(serializer.data)
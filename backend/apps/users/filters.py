@@ -0,0 +1,7 @@
+from django_filters import rest_framework as filters
+from .models import User
+
+class UserFilter(filters.FilterSet):
+    class Meta:
+        model = User
+        fields = ['role', 'is_verified']
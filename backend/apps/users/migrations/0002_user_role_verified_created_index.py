@@ -0,0 +1,22 @@
+# Generated by Django 5.0.1 on 2026-10-16 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_role_0ace22_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'is_verified', '-created_at'], name='users_role_ecf116_idx'),
+        ),
+    ]
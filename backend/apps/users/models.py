@@ -1,6 +1,9 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+# Columns API requests never read from a loaded user
+DEFERRED_USER_FIELDS = ('password', 'last_login', 'date_joined')
+
 class User(AbstractUser):
     ROLE_CHOICES = (
         ('admin', 'Admin'),
@@ -19,7 +22,8 @@ class User(AbstractUser):
         db_table = 'users'
         indexes = [
             models.Index(fields=['email']),
-            models.Index(fields=['role']),
+            # Covers the user list filters and its default ordering
+            models.Index(fields=['role', 'is_verified', '-created_at']),
         ]
     
     def __str__(self):
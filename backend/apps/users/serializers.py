@@ -1,8 +1,15 @@
+import logging
+import time
+from redis.exceptions import RedisError
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -35,3 +42,22 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         data = super().validate(attrs)
         data['user'] = UserSerializer(self.user).data
         return data
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            # Signature and expiry were checked by super(), only claims are needed
+            refresh = self.token_class(attrs['refresh'], verify=False)
+            ttl = max(refresh['exp'] - int(time.time()), 1)
+            # Blacklist the rotated token in the cache for the rest of its
+            # lifetime; add() is atomic so a token can only be rotated once
+            try:
+                added = cache.add(f"blk:{refresh[api_settings.JTI_CLAIM]}", 1, ttl)
+            except RedisError:
+                # Don't lock users out while the cache is down; reuse goes unchecked meanwhile
+                logger.warning('Refresh token blacklist unavailable', exc_info=True)
+                return data
+            if not added:
+                raise InvalidToken('Token is blacklisted')
+        return data
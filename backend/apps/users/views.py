@@ -1,9 +1,13 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from django.contrib.auth import get_user_model
-from .serializers import UserSerializer, UserRegistrationSerializer, CustomTokenObtainPairSerializer
+from .filters import UserFilter
+from .serializers import (
+    UserSerializer, UserRegistrationSerializer, CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer
+)
 
 User = get_user_model()
 
@@ -15,6 +19,9 @@ class UserRegistrationView(generics.CreateAPIView):
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
+class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+
 class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -26,10 +33,13 @@ class UserListView(generics.ListAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filterset_fields = ['role', 'is_verified']
+    filterset_class = UserFilter
     search_fields = ['username', 'email', 'first_name', 'last_name']
+    ordering = ['-created_at']
     
     def get_queryset(self):
+        # Only load the columns the serializer renders
+        queryset = User.objects.only(*UserSerializer.Meta.fields)
         if self.request.user.role == 'admin':
-            return User.objects.all()
-        return User.objects.filter(id=self.request.user.id)
+            return queryset
+        return queryset.filter(id=self.request.user.id)
@@ -0,0 +1,7 @@
+from django_filters import rest_framework as filters
+from .models import VendorProfile
+
+class VendorProfileFilter(filters.FilterSet):
+    class Meta:
+        model = VendorProfile
+        fields = ['status']
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from django.db import models
 from django.conf import settings
 
@@ -51,9 +52,9 @@ class VendorProfile(models.Model):
                                     null=True, blank=True, related_name='verified_vendors')
     verified_at = models.DateTimeField(null=True, blank=True)
     
-    total_sales = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    total_sales = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
     total_orders = models.IntegerField(default=0)
-    rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    rating = models.DecimalField(max_digits=3, decimal_places=2, default=Decimal('0.00'))
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
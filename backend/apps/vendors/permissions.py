@@ -2,7 +2,8 @@ from rest_framework import permissions
 
 class IsVendorOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.user == request.user or request.user.role == 'admin'
+        # Compare the FK column so the owner row is never loaded
+        return obj.user_id == request.user.pk or request.user.role == 'admin'
 
 class IsAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
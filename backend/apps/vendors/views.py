@@ -1,11 +1,19 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
+from django.contrib.auth import get_user_model
 from django.utils import timezone
+from apps.users.models import DEFERRED_USER_FIELDS
+from .filters import VendorProfileFilter
 from .models import VendorProfile
 from .serializers import VendorProfileSerializer, VendorVerificationSerializer
 from .permissions import IsVendorOwner, IsAdmin
 
+User = get_user_model()
+
+# User columns the nested UserSerializer never renders
+UNUSED_USER_FIELDS = [f'user__{field}' for field in DEFERRED_USER_FIELDS]
+
 class VendorProfileCreateView(generics.CreateAPIView):
     serializer_class = VendorProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -13,31 +21,32 @@ class VendorProfileCreateView(generics.CreateAPIView):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         self.request.user.role = 'vendor'
-        self.request.user.save()
+        self.request.user.save(update_fields=['role', 'updated_at'])
 
 class VendorProfileDetailView(generics.RetrieveUpdateAPIView):
-    queryset = VendorProfile.objects.all()
+    queryset = VendorProfile.objects.select_related('user')
     serializer_class = VendorProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsVendorOwner]
 
 class VendorListView(generics.ListAPIView):
-    queryset = VendorProfile.objects.filter(status='approved')
+    queryset = VendorProfile.objects.filter(status='approved').select_related('user').defer(*UNUSED_USER_FIELDS)
     serializer_class = VendorProfileSerializer
     permission_classes = [permissions.AllowAny]
-    filterset_fields = ['status']
+    filterset_class = VendorProfileFilter
     search_fields = ['business_name', 'business_description']
 
 class VendorPublicDetailView(generics.RetrieveAPIView):
     """Public vendor storefront - anyone can view approved vendors"""
-    queryset = VendorProfile.objects.filter(status='approved')
+    queryset = VendorProfile.objects.filter(status='approved').select_related('user')
     serializer_class = VendorProfileSerializer
     permission_classes = [permissions.AllowAny]
 
 class VendorManagementView(generics.ListAPIView):
-    queryset = VendorProfile.objects.all()
+    # Serializer nests the user, join it instead of one query per row
+    queryset = VendorProfile.objects.select_related('user').defer(*UNUSED_USER_FIELDS)
     serializer_class = VendorProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
-    filterset_fields = ['status']
+    filterset_class = VendorProfileFilter
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated, IsAdmin])
@@ -50,8 +59,10 @@ def verify_vendor(request, pk):
             serializer.save(verified_by=request.user, verified_at=timezone.now())
             
             if serializer.validated_data.get('status') == 'approved':
-                vendor.user.is_verified = True
-                vendor.user.save()
+                # Single UPDATE, no need to load the user row
+                User.objects.filter(pk=vendor.user_id).update(
+                    is_verified=True, updated_at=timezone.now()
+                )
             
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -147,5 +147,10 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': config('REDIS_URL', default='redis://localhost:6379/1'),
+        'OPTIONS': {
+            # Keep pooled connections alive and check idle ones before reuse
+            'socket_keepalive': True,
+            'health_check_interval': 30,
+        },
     }
 }
@@ -8,24 +8,50 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
+from django.db.models import Count, Q
+from apps.products.caching import bump_products_version
 from apps.products.models import Product
 
+BATCH_SIZE = 500
+
 def update_all_product_statuses():
-    products = Product.objects.all()
+    # Images are prefetched so is_complete() doesn't query per product
+    products = Product.objects.prefetch_related('images')
+    changed = []
     updated_count = 0
     
-    for product in products:
+    # Stream products in chunks so memory stays flat however large the catalogue is
+    for product in products.iterator(chunk_size=BATCH_SIZE):
         old_status = product.status
-        product.update_status()
+        product.status = 'published' if product.is_complete() else 'draft'
         
         if old_status != product.status:
-            updated_count += 1
+            changed.append(product)
             print(f"Updated {product.name}: {old_status} -> {product.status}")
+        
+        if len(changed) == BATCH_SIZE:
+            # One batched write instead of a save() per product
+            Product.objects.bulk_update(changed, ['status'])
+            updated_count += len(changed)
+            changed = []
+    
+    Product.objects.bulk_update(changed, ['status'])
+    updated_count += len(changed)
+    if updated_count:
+        # bulk_update skips post_save, so invalidate cached listings here
+        bump_products_version()
+    
+    # All counts in a single query
+    counts = Product.objects.aggregate(
+        total=Count('id'),
+        published=Count('id', filter=Q(status='published')),
+        draft=Count('id', filter=Q(status='draft'))
+    )
     
-    print(f"\nTotal products: {products.count()}")
+    print(f"\nTotal products: {counts['total']}")
     print(f"Updated: {updated_count}")
-    print(f"Published: {Product.objects.filter(status='published').count()}")
-    print(f"Draft: {Product.objects.filter(status='draft').count()}")
+    print(f"Published: {counts['published']}")
+    print(f"Draft: {counts['draft']}")
 
 if __name__ == '__main__':
     update_all_product_statuses()
@@ -19,6 +19,30 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// Refresh tokens are rotated and single-use, so concurrent 401s share one refresh
+let refreshPromise: Promise<string> | null = null;
+
+const refreshAccessToken = () => {
+  if (!refreshPromise) {
+    refreshPromise = axios
+      .post(`${API_URL}/auth/token/refresh/`, {
+        refresh: localStorage.getItem('refresh_token'),
+      })
+      .then((response) => {
+        localStorage.setItem('access_token', response.data.access);
+        // The old refresh token is blacklisted once rotated; keep the new one
+        if (response.data.refresh) {
+          localStorage.setItem('refresh_token', response.data.refresh);
+        }
+        return response.data.access;
+      })
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
 api.interceptors.response.use(
   (response) => response,
   async (error) => {
@@ -28,13 +52,8 @@ api.interceptors.response.use(
       originalRequest._retry = true;
       
       try {
-        const refreshToken = localStorage.getItem('refresh_token');
-        const response = await axios.post(`${API_URL}/auth/token/refresh/`, {
-          refresh: refreshToken,
-        });
-        
-        localStorage.setItem('access_token', response.data.access);
-        originalRequest.headers.Authorization = `Bearer ${response.data.access}`;
+        const accessToken = await refreshAccessToken();
+        originalRequest.headers.Authorization = `Bearer ${accessToken}`;
         
         return api(originalRequest);
       } catch (err) {